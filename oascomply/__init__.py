@@ -8,10 +8,28 @@ placed near the library's first use.
 import pathlib
 import jschon
 import jschon.catalog
+
+try:
+    # libyaml's C loader is several times faster than the pure-Python
+    # loader, which matters for multi-megabyte API descriptions.
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    # orjson parses several times faster than the standard library.
+    # Only use this for bundled files: it rejects some input that json
+    # accepts (NaN, 1e400) and rounds very large integers to floats.
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from oascomply.oas30dialect import initialize_oas30_dialect
 
 __all__ = [
-    'schema_catalog'
+    'schema_catalog',
+    'YamlLoader',
+    'json_loads',
 ]
 
 schema_catalog = jschon.create_catalog('2020-12')
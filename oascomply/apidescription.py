@@ -4,7 +4,8 @@ import json
 from pathlib import Path
 import urllib
 from uuid import uuid4
-from collections import defaultdict, namedtuple
+from collections import namedtuple
+from importlib.util import find_spec
 from typing import Any, Iterator, Mapping, Optional, Tuple, Union
 import logging
 import os
@@ -19,7 +20,7 @@ import json_source_map as jmap
 import yaml_source_map as ymap
 from yaml_source_map.errors import InvalidYamlError
 
-from oascomply import schema_catalog
+from oascomply import schema_catalog, YamlLoader
 from oascomply.oasgraph import (
     OasGraph, OasGraphResult, OUTPUT_FORMATS_LINE, OUTPUT_FORMATS_STRUCTURED,
 )
@@ -61,8 +62,23 @@ ANNOT_ORDER = (
 )
 
 
+FILE_TYPES = {
+    '': 'yaml',
+    '.json': 'json',
+    '.yaml': 'yaml',
+    '.yml': 'yaml',
+}
+"""Map of file suffixes to the supported file types; no suffix means YAML"""
+
+
 UriPrefix = namedtuple('UriPrefix', ['directory', 'prefix'])
 
+RDFLIB_STORES = {
+    'none': 'default',  # rdflib's in-memory store
+    'oxigraph': 'Oxigraph',  # in-memory Oxigraph, requires oxrdflib
+}
+"""Maps ``--store`` choices to ``rdflib`` store plugin names"""
+
 
 class ApiDescription:
     """
@@ -83,6 +99,7 @@ class ApiDescription:
         url: Optional[str] = None,
         sourcemap: Optional[Mapping] = None,
         test_mode: bool = False,
+        store: str = 'default',
     ) -> None:
         assert url is None, "Remote URLs not yet supported"
         if uri is not None:
@@ -120,6 +137,7 @@ class ApiDescription:
         self._g = OasGraph(
             self._version[:self._version.rindex('.')],
             test_mode=test_mode,
+            store=store,
         )
 
         self._contents = {}
@@ -252,17 +270,22 @@ class ApiDescription:
             sys.exit(-1)
 
         to_validate = {}
-        by_method = defaultdict(list)
+        # Group by keyword directly; every keyword in ANNOT_ORDER has
+        # a matching OasGraph method, so there is no need to build and
+        # look up a method name for each annotation.
+        by_keyword = {annot: [] for annot in ANNOT_ORDER}
+        instance_base = resource_uri.to_absolute()
         for unit in output['annotations']:
-            ann=Annotation(unit, instance_base=resource_uri.to_absolute())
-            method = f'add_{ann.keyword.lower()}'
-
-            # Using a try/except here can result in confusion if something
-            # else produces an AttributeError, so use hasattr()
-            if hasattr(self._g, method):
-                by_method[method].append((ann, document, data, sourcemap))
-            else:
-                raise ValueError(f"Unexpected annotation {ann.keyword!r}")
+            # Check the keyword before paying for the Annotation's Location
+            keyword = unit['keywordLocation'].rpartition('/')[2]
+            if (annotations := by_keyword.get(keyword)) is None:
+                raise ValueError(f"Unexpected annotation {keyword!r}")
+            annotations.append((
+                Annotation(unit, instance_base=instance_base),
+                document,
+                data,
+                sourcemap,
+            ))
         self._validated.append(resource_uri)
 
         for annot in ANNOT_ORDER:
@@ -279,15 +302,17 @@ class ApiDescription:
                     logger.info('Skipping example validation')
                     continue
 
-            method_name = f'add_{annot.lower()}'
-            method_callable = getattr(self._g, method_name)
-            for args in by_method[method_name]:
+            method_callable = getattr(self._g, f'add_{annot.lower()}')
+            for args in by_keyword[annot]:
                 graph_result = method_callable(*args)
                 for err in graph_result.errors:
                     errors.append(err)
                 for uri, oastype in graph_result.refTargets:
                     to_validate[uri] = oastype
 
+        # Load this document's triples so the buffer does not grow
+        # with the size of the whole API description.
+        self._g.flush()
         return errors
 
     def validate_graph(self):
@@ -317,8 +342,10 @@ class ApiDescription:
             #       to stdout.  This might be an issue with split(), in which
             #       case maybe use split()[:-1]?  Need to check performance
             #       with large graphs.
+            # filter(None, ...) drops the empty lines without calling
+            # back into Python for every line of a potentially huge graph.
             filtered = filter(
-                lambda l: l != '',
+                None,
                 sorted(self._g.serialize(output_format='nt11').split('\n')),
             )
             if destination is None:
@@ -398,9 +425,7 @@ class ApiDescription:
             except ValueError:
                 pass
 
-        filetype = path.suffix[1:] or 'yaml'
-        if filetype == 'yml':
-            filetype = 'yaml'
+        filetype = FILE_TYPES.get(path.suffix, path.suffix[1:])
         logger.debug(f'...determined filetype={filetype}')
 
         if uri is None:
@@ -423,7 +448,7 @@ class ApiDescription:
                 )
                 sourcemap = jmap.calculate(content)
         elif filetype == 'yaml':
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=YamlLoader)
             if create_source_map:
                 # The YAML source mapper gets confused sometimes,
                 # just log a warning and work without the map.
@@ -493,7 +518,7 @@ class ApiDescription:
         path = Path(uri.path)
         if path.exists():
             return uri
-        for suffix in ('.json', '.yaml', '.ym'):
+        for suffix in ('.json', '.yaml', '.yml'):
             ps = path.with_suffix(suffix)
             if ps.exists():
                 return rid.Iri(ps.as_uri())
@@ -626,8 +651,11 @@ class ApiDescription:
             '-t',
             '--store',
             default='none',
-            choices=(('none',)),
-            help="NOT YET IMPLEMENTED "
+            choices=tuple(RDFLIB_STORES),
+            help="The store used to build the graph; 'oxigraph' requires "
+                 "the oxrdflib package and is much faster for large API "
+                 "descriptions, although it writes plain string literals "
+                 "with an explicit xsd:string datatype; "
                  "TODO: Support storing to various kinds of databases.",
         )
         parser.add_argument(
@@ -664,6 +692,10 @@ class ApiDescription:
         if args.directories:
             raise NotImplementedError('-D option not yet implemented')
 
+        if args.store == 'oxigraph' and find_spec('oxrdflib') is None:
+            logger.error("The 'oxigraph' store requires the oxrdflib package")
+            sys.exit(-1)
+
         try:
             prefixes = [cls._process_prefix(p) for p in args.prefixes]
         except ValueError as e:
@@ -693,6 +725,7 @@ class ApiDescription:
             path=primary['path'],
             sourcemap=primary['sourcemap'],
             test_mode=args.test_mode,
+            store=RDFLIB_STORES[args.store],
         )
         for r in resources:
             if r['uri'] != primary['uri']:
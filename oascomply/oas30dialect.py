@@ -16,7 +16,7 @@ import rfc3339
 import rfc3987
 
 from oascomply.ptrtemplates import (
-    JSON_POINTER_TEMPLATE, RELATIVE_JSON_POINTER_TEMPLATE,
+    JSON_POINTER_TEMPLATE_RE, RELATIVE_JSON_POINTER_TEMPLATE_RE,
     RelJsonPtrTemplate,
 )
 import oascomply.resourceid as rid
@@ -486,14 +486,14 @@ def validate_relative_json_pointer(value: str) -> None:
 
 @format_validator('json-pointer-template', instance_types=('string',))
 def validate_relative_json_pointer(value: str) -> None:
-    if not re.fullmatch(JSON_POINTER_TEMPLATE, value):
+    if not JSON_POINTER_TEMPLATE_RE.fullmatch(value):
         raise ValueError
 
 
 @format_validator('relative-json-pointer-template', instance_types=('string',))
 def validate_relative_json_pointer(value: str) -> None:
     RelJsonPtrTemplate(value)
-    if not re.fullmatch(RELATIVE_JSON_POINTER_TEMPLATE, value):
+    if not RELATIVE_JSON_POINTER_TEMPLATE_RE.fullmatch(value):
         raise ValueError
 
 
@@ -586,6 +586,7 @@ def validate_with_oas30():
     import argparse
     import yaml
     import json
+    from oascomply import YamlLoader
 
     parser = argparse.ArgumentParser(
         description='Validates the instance against schemas using the '
@@ -643,7 +644,7 @@ def validate_with_oas30():
     # TODO: Actually detect and parse json properly
     sys.stderr.write(f'Loading instance {args.instance}...\n')
     with open(args.instance) as inst_fd:
-        instance = JSON(yaml.safe_load(inst_fd))
+        instance = JSON(yaml.load(inst_fd, Loader=YamlLoader))
 
     # TODO: Be more forgiving about the load order of refschemas,
     #       as this means that a schema can only a reference another
@@ -653,7 +654,7 @@ def validate_with_oas30():
         sys.stderr.write(f'Loading ref schema {ref}...\n')
         with open(ref) as ref_fd:
             ref_schema = JSONSchema(
-                yaml.safe_load(ref_fd),
+                yaml.load(ref_fd, Loader=YamlLoader),
                 metaschema_uri=metaschema_uri,
             )
             meta_result = ref_schema.validate()
@@ -663,7 +664,7 @@ def validate_with_oas30():
     sys.stderr.write(f'Loading schema {args.schema}...\n')
     with open(args.schema) as schema_fd:
         schema = JSONSchema(
-            yaml.safe_load(schema_fd),
+            yaml.load(schema_fd, Loader=YamlLoader),
             metaschema_uri=metaschema_uri,
         )
         meta_result = schema.validate()
@@ -1,7 +1,6 @@
 import json
-import re
 from collections import namedtuple
-from functools import cached_property
+from functools import cached_property, lru_cache
 from itertools import chain
 from pathlib import Path
 from uuid import uuid4
@@ -63,13 +62,77 @@ OUTPUT_FORMATS_STRUCTURED = frozenset({
 OasGraphResult = namedtuple('Graphresult', ['errors', 'refTargets'])
 Triple = namedtuple('Triple', ['subject', 'predicate', 'object'])
 
+
+# oastypes that are labeled by other oastypes on the same node
+# TODO: Reconsider having these oastype at all
+UNLABELED_OASTYPES = frozenset({
+    'PathOnlyTemplatedUrl', 'StatusCode', 'TemplateParameter',
+})
+
+# oastypes labeled with their type and the key under which they appear
+KEYED_LABEL_OASTYPES = frozenset({
+    'Callback', 'Encoding', 'Link', 'Response',
+})
+
+# oastypes labeled only with the key under which they appear
+KEY_ONLY_LABEL_OASTYPES = frozenset({'Header', 'MediaType'})
+
+
+# DefinedNamespace attribute access goes through a metaclass __getattr__
+# on every use, so bind the terms used for nearly every node just once.
+RDF_TYPE = RDF.type
+RDFS_LABEL = RDFS.label
+
+
+@lru_cache(maxsize=None)
+def _parse_child_template(template: str) -> RelJsonPtrTemplate:
+    """
+    Parse a relative JSON Pointer template from an annotation value
+
+    The OAS schema uses only a small, fixed set of templates, each of
+    which is applied to many nodes, and a parsed template is not
+    modified by evaluating it.
+    """
+    return RelJsonPtrTemplate(template)
+
+
+@lru_cache(maxsize=None)
+def _parse_child_relptr(rdf_name: str) -> Optional[rid.RelJsonPtr]:
+    """
+    Parse the relative JSON Pointer used as a child's relation name
+
+    Returns ``None`` if the name is a literal name rather than a pointer.
+    """
+    return rid.RelJsonPtr(rdf_name) if rdf_name[:1].isdigit() else None
+
+
+class _TermCache(dict):
+    """
+    Namespace terms keyed by local name, created on first use
+
+    ``rdflib.Namespace`` builds and validates a new ``URIRef`` on every
+    lookup, while the OAS ontology only has a small, fixed set of terms
+    that are looked up for nearly every node in the graph.
+    """
+    def __init__(self, namespace):
+        super().__init__()
+        self._namespace = namespace
+
+    def __missing__(self, name):
+        term = self[name] = self._namespace[name]
+        return term
+
+
 class OasGraph:
     """
     Graph representing an OAS API description
 
     :param version: The X.Y OAS version string for the description
+    :param store: The name of the ``rdflib`` store plugin to use; installing
+        the ``oxrdflib`` package provides the much faster Rust-based
+        ``"Oxigraph"`` store, which is recommended for large descriptions
     """
-    def __init__(self, version: str, *, test_mode=False):
+    def __init__(self, version: str, *, test_mode=False, store='default'):
         if version not in ('3.0', '3.1'):
             raise ValueError(f'OAS v{version} is not supported.')
         if version == '3.1':
@@ -77,7 +140,14 @@ class OasGraph:
         self._version = version
         self._test_mode = test_mode
 
-        self._g = rdflib.Graph()
+        self._g = rdflib.Graph(store=store)
+
+        # Triples are buffered and bulk-loaded with Graph.addN(), which
+        # avoids per-triple store dispatch; see flush()
+        self._pending = []
+
+        # Parsed child templates, keyed by schema location and keyword
+        self._child_templates = {}
         self._oas_unversioned = rdflib.Namespace(
             'https://spec.openapis.org/compliance/ontology#'
         )
@@ -93,6 +163,9 @@ class OasGraph:
         self._g.bind('oas3.0', self._oas_versions['3.0'])
         self._g.bind('oas3.1', self._oas_versions['3.1'])
 
+        self._oas_terms = _TermCache(self._oas_unversioned)
+        self._oas_v_terms = _TermCache(self._oas_versions[version])
+
     @cached_property
     def oas(self):
         return self._oas_unversioned
@@ -101,8 +174,21 @@ class OasGraph:
     def oas_v(self):
         return self._oas_versions[self._version]
 
+    def flush(self):
+        """
+        Add all buffered triples to the underlying ``rdflib`` graph.
+
+        This is called automatically before the graph is read, but
+        can be called directly to bound the size of the buffer.
+        """
+        if self._pending:
+            g = self._g
+            g.addN((s, p, o, g) for s, p, o in self._pending)
+            self._pending.clear()
+
     def serialize(self, *args, base=None, output_format=None, **kwargs):
         """Serialize the graph using the given output format."""
+        self.flush()
         if output_format == 'toml':
             return self.to_toml(*args, **kwargs)
         kw = kwargs.copy()
@@ -116,6 +202,7 @@ class OasGraph:
         )
 
     def to_toml(self, *args, destination, order, **kwargs):
+        self.flush()
         data = {
             'namespaces': {
                 'rdf': str(RDF),
@@ -172,19 +259,19 @@ class OasGraph:
     def add_resource(self, url, uri, filename=None):
         rdf_node = rdflib.URIRef(str(uri))
         if not self._test_mode:
-            self._g.add((
+            self._pending.append((
                 rdf_node,
-                self.oas['locatedAt'],
+                self._oas_terms['locatedAt'],
                 rdflib.Literal(str(url), datatype=XSD.anyURI),
             ))
-        self._g.add((
+        self._pending.append((
             rdf_node,
-            RDF.type,
+            RDF_TYPE,
             rdflib.URIRef('https://schema.org/DigitalDocument'),
         ))
-        self._g.add((
+        self._pending.append((
             rdf_node,
-            self.oas['root'],
+            self._oas_terms['root'],
             rdf_node + '#',
         ))
         if filename is None:
@@ -192,18 +279,15 @@ class OasGraph:
                 filename = url.path.split('/')[-1]
 
         if filename:
-            self._g.add((
+            self._pending.append((
                 rdf_node,
-                RDFS.label,
+                RDFS_LABEL,
                 rdflib.Literal(filename),
             ))
 
     def _create_label(self, location, document, data, instance_uri, oastype):
-        if oastype in (
-            'PathOnlyTemplatedUrl', 'StatusCode', 'TemplateParameter',
-        ):
+        if oastype in UNLABELED_OASTYPES:
             # These are handled by other types on the same node
-            # TODO: Reconsider having these oastype at all
             return
 
         elif oastype.endswith('Operation'):
@@ -219,16 +303,14 @@ class OasGraph:
                     else f"Op:{location.instance_ptr[-1]}"
                 )
 
-        elif oastype in (
-            'Callback', 'Encoding', 'Link', 'Response',
-        ):
+        elif oastype in KEYED_LABEL_OASTYPES:
             try:
                 label = rdflib.Literal(f"{oastype}:{location.instance_ptr[-1]}")
             except IndexError:
                 # TODO: handle path item at root of file
                 label = None
 
-        elif oastype in ('Header', 'MediaType'):
+        elif oastype in KEY_ONLY_LABEL_OASTYPES:
             label = rdflib.Literal(location.instance_ptr[-1])
 
         elif oastype == 'PathItem':
@@ -259,18 +341,18 @@ class OasGraph:
             label = rdflib.Literal(oastype)
 
         if label is not None:
-            self._g.add((
+            self._pending.append((
                 instance_uri,
-                RDFS.label,
+                RDFS_LABEL,
                 label,
             ))
 
     def add_oastype(self, annotation, document, data, sourcemap):
-        instance_uri = rdflib.URIRef(str(annotation.location.instance_uri))
-        self._g.add((
+        instance_uri = annotation.location.instance_uriref
+        self._pending.append((
             instance_uri,
-            RDF.type,
-            self.oas_v[annotation.value],
+            RDF_TYPE,
+            self._oas_v_terms[annotation.value],
         ))
         self._create_label(
             annotation.location,
@@ -280,10 +362,10 @@ class OasGraph:
             annotation.value,
         )
         if sourcemap:
-            self._g.add((
+            self._pending.append((
                 instance_uri,
-                RDF.type,
-                self.oas['ParsedStructure'],
+                RDF_TYPE,
+                self._oas_terms['ParsedStructure'],
             ))
             self.add_sourcemap(
                 instance_uri,
@@ -298,14 +380,14 @@ class OasGraph:
             else:
                 map_key = ''
             entry = sourcemap[map_key]
-            self._g.add((
+            self._pending.append((
                 instance_rdf_uri,
-                self.oas['line'],
+                self._oas_terms['line'],
                 rdflib.Literal(entry.value_start.line),
             ))
-            self._g.add((
+            self._pending.append((
                 instance_rdf_uri,
-                self.oas['column'],
+                self._oas_terms['column'],
                 rdflib.Literal(entry.value_start.column),
             ))
 
@@ -317,23 +399,39 @@ class OasGraph:
         value_processor=None,
     ):
         parent_obj = annotation.location.instance_ptr.evaluate(document)
-        for child_template, rdf_name in annotation.value.items():
-            relptr = None
-            if re.match(r'\d', rdf_name):
-                relptr = rid.RelJsonPtr(rdf_name)
-                rdf_name = None
-
+        for template, relptr, rdf_name in self._get_child_templates(
+            annotation,
+        ):
             yield from (
                 (
                     result,
                     rdf_name if rdf_name
                         else relptr.evaluate(result.data),
                 )
-                for result in RelJsonPtrTemplate(
-                    child_template,
-                ).evaluate(parent_obj)
+                for result in template.evaluate(parent_obj)
             )
 
+    def _get_child_templates(self, annotation):
+        """
+        Return the parsed ``(template, relptr, rdf_name)`` child entries
+
+        An annotation's value is fixed by the schema keyword that
+        produced it, so the entries are parsed once per schema location
+        and keyword rather than for every instance node of that type.
+        """
+        cache_key = (annotation.location.schema_uri, annotation.keyword)
+        if (entries := self._child_templates.get(cache_key)) is None:
+            entries = []
+            for child_template, rdf_name in annotation.value.items():
+                relptr = _parse_child_relptr(rdf_name)
+                entries.append((
+                    _parse_child_template(child_template),
+                    relptr,
+                    None if relptr is not None else rdf_name,
+                ))
+            self._child_templates[cache_key] = entries
+        return entries
+
     def _flatten_template_array(
             self,
             location,
@@ -342,36 +440,35 @@ class OasGraph:
     ):
         return chain.from_iterable((
             (
-                r for r in RelJsonPtrTemplate(t).evaluate(data)
+                r for r in _parse_child_template(t).evaluate(data)
             )
             for t in template_array
         ))
 
     def add_oaschildren(self, annotation, document, data, sourcemap):
         location = annotation.location
-        parent_uri = rdflib.URIRef(str(location.instance_uri))
+        parent_uri = location.instance_uriref
+        # Concatenating the fragment avoids the compose-and-reparse
+        # cycle of copy_with() for every child.
+        resource_uri_str = str(location.instance_resource_uri)
+
+        # Bind what the loop uses to locals, as this runs for
+        # nearly every node in the description.
+        append = self._pending.append
+        oas_terms = self._oas_terms
+        parent_term = oas_terms['parent']
         try:
             for result, relname in self._resolve_child_template(
                 annotation,
                 document,
                 data,
         ):
-                child_obj = result.data
-                child_path = rid.JsonPtr(child_obj.path)
-                iu = location.instance_uri
-                child_uri = rdflib.URIRef(str(iu.copy_with(
-                    fragment=child_path,
-                )))
-                self._g.add((
-                    parent_uri,
-                    self.oas[relname],
-                    child_uri,
-                ))
-                self._g.add((
-                    child_uri,
-                    self.oas['parent'],
-                    parent_uri,
-                ))
+                child_path = rid.JsonPtr(result.data.path)
+                child_uri = rdflib.URIRef(
+                    f'{resource_uri_str}#{child_path.uri_fragment()}',
+                )
+                append((parent_uri, oas_terms[relname], child_uri))
+                append((child_uri, parent_term, parent_uri))
                 if sourcemap:
                     self.add_sourcemap(
                         child_uri,
@@ -388,7 +485,7 @@ class OasGraph:
 
     def add_oasliterals(self, annotation, document, data, sourcemap):
         location = annotation.location
-        parent_uri = rdflib.URIRef(str(location.instance_uri))
+        parent_uri = location.instance_uriref
         try:
             for result, relname in self._resolve_child_template(
                 annotation,
@@ -402,9 +499,9 @@ class OasGraph:
                     if literal.type in ('object', 'array')
                     else rdflib.Literal(literal.value)
                 )
-                self._g.add((
+                self._pending.append((
                     parent_uri,
-                    self.oas[relname],
+                    self._oas_terms[relname],
                     literal_node,
                 ))
                 # TODO: Sourcemap for literals?  might need
@@ -430,7 +527,7 @@ class OasGraph:
 
     def _add_links(self, annotation, document, data, sourcemap, entity):
         location = annotation.location
-        parent_uri = rdflib.URIRef(str(location.instance_uri))
+        parent_uri = location.instance_uriref
         try:
             for result, relname in self._resolve_child_template(
                 annotation,
@@ -440,15 +537,15 @@ class OasGraph:
                 link_obj = result.data
                 link_path = rid.JsonPtr(link_obj.path)
                 link_uri = rdflib.URIRef(str(link_obj.value))
-                self._g.add((
+                self._pending.append((
                     parent_uri,
-                    self.oas[relname],
+                    self._oas_terms[relname],
                     link_uri,
                 ))
-                self._g.add((
+                self._pending.append((
                     link_uri,
-                    RDF.type,
-                    self.oas[entity],
+                    RDF_TYPE,
+                    self._oas_terms[entity],
                 ))
             return OasGraphResult(errors=[], refTargets=[])
         except (
@@ -480,34 +577,34 @@ class OasGraph:
                     str(ref_uri_ref),
                     datatype=XSD.anyURI
                 )
-                self._g.add((
+                self._pending.append((
                     rdf_ref_source_uri,
-                    RDF.type,
-                    self.oas['JSONReference'],
+                    RDF_TYPE,
+                    self._oas_terms['JSONReference'],
                 ))
-                self._g.add((
-                    rdflib.URIRef(str(location.instance_uri)),
-                    self.oas[ref_keyword],
+                self._pending.append((
+                    location.instance_uriref,
+                    self._oas_terms[ref_keyword],
                     rdf_ref_source_uri,
                 ))
-                self._g.add((
+                self._pending.append((
                     rdf_ref_source_uri,
-                    self.oas['references'],
+                    self._oas_terms['references'],
                     rdf_ref_target_uri,
                 ))
-                self._g.add((
+                self._pending.append((
                     rdf_ref_source_uri,
-                    self.oas['referenceValue'],
+                    self._oas_terms['referenceValue'],
                     rdf_ref_value,
                 ))
-                self._g.add((
+                self._pending.append((
                     rdf_ref_source_uri,
-                    RDFS.label,
+                    RDFS_LABEL,
                     rdf_ref_value,
                 ))
-                self._g.add((
+                self._pending.append((
                     rdf_ref_source_uri,
-                    self.oas['referenceBase'],
+                    self._oas_terms['referenceBase'],
                     rdflib.Literal(
                         rdflib.URIRef(
                             str(location.instance_uri.to_absolute())
@@ -515,9 +612,9 @@ class OasGraph:
                         datatype=XSD.anyURI,
                     ),
                 ))
-                self._g.add((
+                self._pending.append((
                     rdf_ref_source_uri,
-                    self.oas['targetType'],
+                    self._oas_terms['targetType'],
                     rdflib.Literal(reftype),
                 ))
 
@@ -552,7 +649,7 @@ class OasGraph:
         errors = []
         location = annotation.location
         parent_obj = location.instance_ptr.evaluate(document)
-        parent_uri = rdflib.URIRef(str(location.instance_uri))
+        parent_uri = location.instance_uriref
 
         schemas = []
         if 'schemas' in annotation.value:
@@ -582,11 +679,14 @@ class OasGraph:
                 ))
 
         # TODO: Handle encoding objects
-        if 'encodings' in annotation.value and len(list(
+        # Only whether there is any Encoding Object matters,
+        # so stop evaluating the templates at the first one.
+        if 'encodings' in annotation.value and next(
             self._flatten_template_array(
                 location, annotation.value['encodings'], parent_obj,
-            )
-        )):
+            ),
+            None,
+        ) is not None:
             logger.warning(
                 'Validating examples/defaut with Encoding Objects '
                 'not yet supported',
@@ -604,9 +704,9 @@ class OasGraph:
                     'default' if result.pointer.path[-1] == 'default'
                     else 'example'
                 )
-                self._g.add((
+                self._pending.append((
                     parent_uri,
-                    self.oas[relname],
+                    self._oas_terms[relname],
                     rdflib.Literal(str(example), datatype=RDF.JSON),
                 ))
                 for schema in schemas:
@@ -635,18 +735,18 @@ class OasGraph:
 
     def add_oasextensible(self, annotation, document, data, sourcemap):
         if annotation.value is True:
-            parent_uri = rdflib.URIRef(str(annotation.location.instance_uri))
+            parent_uri = annotation.location.instance_uriref
             parent_obj = annotation.location.instance_ptr.evaluate(document)
-            self._g.add((
+            self._pending.append((
                 parent_uri,
-                self.oas['allowsExtensions'],
+                self._oas_terms['allowsExtensions'],
                 rdflib.Literal(True),
             ))
             return OasGraphResult(errors=[], refTargets=[])
 
     def _check_oastype(self, subject, oastype, label):
         errors = []
-        expected = (subject, RDF.type, self.oas_v[oastype])
+        expected = (subject, RDF.type, self._oas_v_terms[oastype])
         if expected not in self._g:
             errors.append({
                 'location': 'TODO',
@@ -697,6 +797,7 @@ class OasGraph:
         return core_type
 
     def validate_json_references(self):
+        self.flush()
         errors = []
         for json_ref_node, p, target_node in self._g.triples(
             (None, self.oas.references, None)
@@ -756,8 +857,8 @@ class OasGraph:
             if context_node:
                 context['node'] = context_node
 
-            actual = self.oas_v[self._extract_core_type(target_node)]
-            expected = self.oas_v[expected]
+            actual = self._oas_v_terms[self._extract_core_type(target_node)]
+            expected = self._oas_v_terms[expected]
             if expected != actual:
                 errors.append({
                     'location': 'TODO',
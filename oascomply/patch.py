@@ -12,8 +12,7 @@ from jschon import JSONSchema
 from jschon.vocabulary import Metaschema
 from jschon.jsonpatch import JSONPatch
 
-from oascomply import schema_catalog
-
+from oascomply import schema_catalog, YamlLoader
 
 REPO_ROOT = (Path(__file__).parent / '..' ).resolve() 
 
@@ -92,7 +91,7 @@ def yaml_to_json():
         with infile.open() as in_fp, outfiles[index].open(
             'w', encoding='utf-8'
         ) as out_fp:
-            json.dump(yaml.safe_load(in_fp), out_fp, **kwargs)
+            json.dump(yaml.load(in_fp, Loader=YamlLoader), out_fp, **kwargs)
 
 
 def validate_schema(schema_data, *metaschema_data, error_format='detailed'):
@@ -165,7 +164,7 @@ def patch():
     merge_patch = oas_patch_dir / 'v3.0' / 'merge-patch.yaml'
     print(f'Applying JSON Merge Patch (RFC 7396) "{merge_patch}" ...')
     with open(merge_patch, encoding='utf-8') as merge_fp:
-        merge = yaml.safe_load(merge_fp)
+        merge = yaml.load(merge_fp, Loader=YamlLoader)
     json_merge_patch.merge(patched, merge)
 
     # move $defs to the end after patching in more root-level keywords.
@@ -1,5 +1,6 @@
 from typing import Generator, Sequence, Tuple, Union
 from collections import namedtuple
+from functools import lru_cache
 import re
 import jschon
 
@@ -19,6 +20,9 @@ RELATIVE_JSON_POINTER_TEMPLATE = (
     f'{PARENT_COUNT}{INDEX_MANIPULATION}(#|{JSON_POINTER_TEMPLATE})'
 )
 
+JSON_POINTER_TEMPLATE_RE = re.compile(JSON_POINTER_TEMPLATE)
+RELATIVE_JSON_POINTER_TEMPLATE_RE = re.compile(RELATIVE_JSON_POINTER_TEMPLATE)
+
 
 TemplateResult = namedtuple(
     'TemplateResult',
@@ -44,38 +48,47 @@ class JsonPtrTemplateEvaluationError(JsonPtrTemplateError):
 
 class JsonPtrTemplate:
     def __init__(self, template: str):
-        if (m := re.fullmatch(JSON_POINTER_TEMPLATE, template)) is None:
+        # Components are one of:
+        # * JsonPtr instances
+        # * A template variable name (str instance)
+        # * Boolean True to request the name of the key or number
+        #   of the index matching the previous variable; this can
+        #   only occur as the last component
+        self._components = list(self._parse(template))
+        self._template = template
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse(template: str) -> Tuple[Union[JsonPtr, str, bool], ...]:
+        # The same few templates are constructed over and over,
+        # so cache the validated components (but not errors).
+        if (m := JSON_POINTER_TEMPLATE_RE.fullmatch(template)) is None:
             raise InvalidJsonPtrTemplateError(
                 f'{template!r} is not a valid JsonPtrTemplate!'
             )
-        self._template = template
 
         # Splitting '' results in [''], and '/' in ['', ''],
         # so always remove the initial ''
         segments = template.split('/')[1:]
 
-        # Components are one of:
-        # * JsonPtr instances
-        # * A template variable name (str instance)
-        # * Boolean True to request the name of the key or number
-        #   of the index matching the previous variable; this can
-        #   only occur as the last component
-        self._components= []
-        currptr = JsonPtr()
+        # Collect each run of literal keys and build its pointer once
+        components = []
+        keys = []
         for s in segments:
             if s.startswith('{'):
-                if len(currptr) > 0:
-                    self._components.append(currptr)
-                    currptr = JsonPtr()
+                if keys:
+                    components.append(JsonPtr(keys))
+                    keys = []
                 if s.endswith('#'):
-                    self._components.extend((s[1:-2], True))
+                    components.extend((s[1:-2], True))
                 else:
-                    self._components.append(s[1:-1])
+                    components.append(s[1:-1])
             else:
-                currptr /= self.unescape(s)
+                keys.append(JsonPtrTemplate.unescape(s))
 
-        if len(currptr) or not len(self._components):
-            self._components.append(currptr)
+        if keys or not components:
+            components.append(JsonPtr(keys))
+        return tuple(components)
 
     def __str__(self):
         return self._template
@@ -91,71 +104,64 @@ class JsonPtrTemplate:
         instance: jschon.JSON,
         *,
         require_match: bool = False,
-        _index=0,
-        _resolved=JsonPtr(),
-        _variables=None,
-        _previous_variable=None,
-    ) -> Generator[
-        Tuple[JsonPtr, jschon.JSON, Union[None, str, int]],
-        None,
-        None,
-    ]:
-        remaining = self._components[_index:]
-        variables = _variables or {}
-
-        if len(remaining) == 0:
-            yield TemplateResult(_resolved, instance, variables, None)
-            return
-
-        next_c = remaining[0]
-        if isinstance(next_c, JsonPtr):
-            new_resolved = _resolved / next_c
-            try:
-                new_instance = next_c.evaluate(instance)
-            except jschon.JSONPointerError as e:
-                if not require_match:
-                    return
-                raise JsonPtrTemplateEvaluationError(
-                    f"Path '{new_resolved}' not found in document {instance} while "
-                    f"evaluating template '{self}'"
-                ) from e
-
-            yield from self.evaluate(
-                new_instance,
-                require_match=require_match,
-                _index=_index + 1,
-                _resolved=new_resolved,
-                _variables=variables,
-            )
-
-        elif isinstance(next_c, str):
-            if instance.type == 'array':
-                keys = range(len(instance))
-            elif instance.type == 'object':
-                keys = instance.keys()
-            else:
-                raise JsonPtrTemplateEvaluationError(
-                    f"Cannot match template variable {next_c!r} from "
-                    f"template '{self}' – instance locattion '{_resolved}' "
-                    f"is a {instance.type!r}, not an array or object."
+    ) -> Generator[TemplateResult, None, None]:
+        components = self._components
+        num_components = len(components)
+
+        # Depth-first traversal using an explicit stack of
+        # (component index, instance, resolved pointer, variables)
+        # rather than a recursive generator per component.  Siblings
+        # are pushed in reverse so that they are yielded in order.
+        stack = [(0, instance, JsonPtr(), {})]
+        while stack:
+            index, instance, resolved, variables = stack.pop()
+
+            if index == num_components:
+                yield TemplateResult(resolved, instance, variables, None)
+                continue
+
+            next_c = components[index]
+            if isinstance(next_c, JsonPtr):
+                new_resolved = resolved / next_c
+                try:
+                    new_instance = next_c.evaluate(instance)
+                except jschon.JSONPointerError as e:
+                    if not require_match:
+                        continue
+                    raise JsonPtrTemplateEvaluationError(
+                        f"Path '{new_resolved}' not found in document "
+                        f"{instance} while evaluating template '{self}'"
+                    ) from e
+
+                stack.append(
+                    (index + 1, new_instance, new_resolved, variables),
                 )
 
-            for key in keys:
-                newvars = variables.copy()
-                newvars[next_c] = key
-                yield from (
-                    self.evaluate(
-                        instance[key],
-                        require_match=require_match,
-                        _index=_index + 1,
-                        _resolved=_resolved / str(key),
-                        _variables=newvars,
+            elif isinstance(next_c, str):
+                if instance.type == 'array':
+                    keys = range(len(instance))
+                elif instance.type == 'object':
+                    keys = tuple(instance.keys())
+                else:
+                    raise JsonPtrTemplateEvaluationError(
+                        f"Cannot match template variable {next_c!r} from "
+                        f"template '{self}' – instance locattion '{resolved}' "
+                        f"is a {instance.type!r}, not an array or object."
                     )
-                )
-        else:
-            assert next_c is True
-            prev_val = next(reversed(variables.values()))
-            yield TemplateResult(_resolved, instance, variables, prev_val)
+
+                for key in reversed(keys):
+                    newvars = variables.copy()
+                    newvars[next_c] = key
+                    stack.append((
+                        index + 1,
+                        instance[key],
+                        resolved / str(key),
+                        newvars,
+                    ))
+            else:
+                assert next_c is True
+                prev_val = next(reversed(variables.values()))
+                yield TemplateResult(resolved, instance, variables, prev_val)
 
 
     @staticmethod
@@ -170,6 +176,10 @@ class JsonPtrTemplate:
 
     @staticmethod
     def unescape(component):
+        # Most components have nothing escaped, so check with
+        # one scan instead of four replace() scans.
+        if '~' not in component:
+            return component
         return (
             component
                 .replace('~3', '}')
@@ -1,4 +1,4 @@
-from functools import cached_property
+from functools import cached_property, lru_cache
 import logging
 from typing import overload
 import urllib
@@ -140,7 +140,9 @@ class RelJsonPtr(jschon.RelativeJSONPointer):
 
 class JsonPtr(jschon.JSONPointer):
     @classmethod
+    @lru_cache(maxsize=4096)
     def parse_uri_fragment(cls, value):
+        # Pointers are not modified in place, so they can be shared
         return JsonPtr(urllib.parse.unquote(value))
 
     def __eq__(self, other):
@@ -191,13 +193,17 @@ class JsonPtr(jschon.JSONPointer):
                 p = p / suffix.path
             return p
 
-        return JsonPtr(str(super().__truediv__(suffix)))
+        # Copy the keys rather than serializing and re-parsing them
+        result = super().__truediv__(suffix)
+        return result if result is NotImplemented else JsonPtr(result)
 
     def __getitem__(self, index):
         if isinstance(index, int):
             return self._keys[index]
         if isinstance(index, slice):
-            return JsonPtr(str(super().__getitem__(index)))
+            # Build from the already-unescaped keys rather than
+            # serializing and re-parsing the sliced pointer.
+            return JsonPtr(self._keys[index])
 
 
 # TODO: Would it be better to have this independent of IriReference
@@ -1,5 +1,5 @@
-import json
-from functools import cached_property
+import threading
+from functools import cached_property, lru_cache
 from pathlib import Path
 from uuid import uuid4
 from typing import Any, Optional, Union
@@ -10,6 +10,7 @@ import rdflib
 from rdflib.namespace import RDF
 import yaml
 
+from oascomply import json_loads
 from oascomply.oasgraph import OasGraph
 import oascomply.resourceid as rid
 
@@ -20,6 +21,10 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+V30_SCHEMA_PATH = (
+    Path(__file__).parent / '..' / 'schemas' / 'oas' / 'v3.0' / 'schema.json'
+).resolve()
+
 
 class JsonSchemaParseError(ValueError):
     def __init__(self, error_detail):
@@ -31,11 +36,12 @@ class JsonSchemaParseError(ValueError):
 
 
 class Annotation:
+    # One of these is created per output unit, so avoid a per-instance dict
+    __slots__ = ('_location', '_keyword', '_value')
+
     def __init__(self, unit, instance_base=None):
         self._location = Location.get(unit, instance_base)
-        self._keyword = unit['keywordLocation'][
-            unit['keywordLocation'].rindex('/') + 1:
-        ]
+        self._keyword = unit['keywordLocation'].rpartition('/')[2]
         self._value = unit['annotation']
 
     def __repr__(self):
@@ -57,8 +63,55 @@ class Annotation:
         return self._value
 
 
+# Basic output repeats the same location strings across many units,
+# so the pointers and URIs parsed from them are shared through these
+# bounded caches; see Location.clear_caches()
+LOCATION_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _instance_ptr(instance_location: str) -> rid.JsonPtr:
+    return rid.JsonPtr(instance_location)
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _eval_ptr(evaluation_path: str) -> rid.JsonPtr:
+    return rid.JsonPtr(evaluation_path)
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _instance_uri(
+    instance_resource_uri: rid.IriWithJsonPtr,
+    instance_location: str,
+) -> rid.IriWithJsonPtr:
+    # copy_with() composes and re-parses the whole IRI
+    return instance_resource_uri.copy_with(
+        fragment=_instance_ptr(instance_location),
+    )
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _schema_uri(schema_location: str) -> rid.IriWithJsonPtr:
+    return rid.IriWithJsonPtr(schema_location)
+
+
 class Location:
-    _cache = {}
+    # Default instance base URI, created when first needed
+    _dibu = None
+
+    @classmethod
+    def clear_caches(cls):
+        """
+        Discard all shared Locations and the values cached to build them
+        """
+        for cache in (
+            _location_for,
+            _instance_ptr,
+            _eval_ptr,
+            _instance_uri,
+            _schema_uri,
+        ):
+            cache.cache_clear()
 
     @classmethod
     def _get_instance_base_uri(cls, base=None):
@@ -67,50 +120,51 @@ class Location:
                 return base
             else:
                 return rid.IriWithJsonPtr(str(base))
-        try:
-            return cls._default_instance_base
-        except AttributeError:
+        if cls._dibu is None:
             # NOTE: This ony works if there is only one instance document.
             # TODO: Guard against messing it up?  Do we even need this?
             cls._dibu = rid.Iri(f'urn:uuid:{uuid4()}')
-        return cls._default_instance_base
+        return cls._dibu
 
     @classmethod
     def get(cls, unit: dict, instance_base: Union[str, rid.Iri] = None):
-        eval_ptr = rid.JsonPtr(unit['keywordLocation'])[:-1]
+        """
+        Return a possibly shared :class:`Location` for an output unit
 
-        cache_key = (
+        Use :meth:`clear_caches` to discard shared instances.
+        """
+        # Units for different keywords in the same schema object share
+        # a Location, so key on the locations with the keyword dropped.
+        return _location_for(
             cls._get_instance_base_uri(instance_base),
             unit['instanceLocation'],
-            eval_ptr,
+            unit['keywordLocation'].rpartition('/')[0],
+            unit['absoluteKeywordLocation'].rpartition('/')[0],
         )
-        try:
-            return cls._cache[cache_key]
-        except KeyError:
-            loc = Location(
-                unit,
-                eval_ptr=eval_ptr,
-                instance_base=instance_base,
-            )
-            cls._cache[cache_key] = loc
-            return loc
 
     def __init__(
         self,
-        unit,
+        instance_location: str,
+        evaluation_path: str,
+        schema_location: str,
         *,
-        eval_ptr=None,
         instance_base=None
     ):
-        self._unit = unit
+        self._instance_location = instance_location
+        self._schema_location = schema_location
         self._given_base = instance_base
-        self._eval_ptr = (
-            rid.JsonPtr(unit['keywordLocation'])[:-1] if eval_ptr is None
-            else eval_ptr
+        self._eval_ptr = _eval_ptr(evaluation_path)
+
+    def __eq__(self, other):
+        if not isinstance(other, Location):
+            return NotImplemented
+        return (
+            self.instance_uri == other.instance_uri and
+            self._eval_ptr == other._eval_ptr
         )
 
     def __hash__(self):
-        return hash((self._instance_uri, self._eval_ptr))
+        return hash((self.instance_uri, self._eval_ptr))
 
     def __repr__(self):
         return 'Location(' + repr({
@@ -127,13 +181,19 @@ class Location:
 
     @cached_property
     def instance_uri(self) -> rid.Iri:
-        return self.instance_resource_uri.copy_with(
-            fragment=self.instance_ptr
+        return _instance_uri(
+            self.instance_resource_uri,
+            self._instance_location,
         )
 
+    @cached_property
+    def instance_uriref(self) -> rdflib.URIRef:
+        """The instance URI as a graph node"""
+        return rdflib.URIRef(str(self.instance_uri))
+
     @cached_property
     def instance_ptr(self) -> rid.JsonPtr:
-        return rid.JsonPtr(self._unit['instanceLocation'])
+        return _instance_ptr(self._instance_location)
 
     @cached_property
     def evaluation_path_ptr(self) -> rid.JsonPtr:
@@ -141,12 +201,28 @@ class Location:
 
     @cached_property
     def schema_resource_uri(self) -> rid.Iri:
-        return self.schema_uri.to_absolute()
+        return rid.IriWithJsonPtr(
+            self._schema_location.partition('#')[0],
+        )
 
     @cached_property
     def schema_uri(self) -> rid.Iri:
-        s_uri = rid.IriWithJsonPtr(self._unit['absoluteKeywordLocation'])
-        return s_uri.copy_with(fragment=s_uri.fragment[:-1])
+        return _schema_uri(self._schema_location)
+
+
+@lru_cache(maxsize=LOCATION_CACHE_SIZE)
+def _location_for(
+    instance_base: rid.IriWithJsonPtr,
+    instance_location: str,
+    evaluation_path: str,
+    schema_location: str,
+) -> Location:
+    return Location(
+        instance_location,
+        evaluation_path,
+        schema_location,
+        instance_base=instance_base,
+    )
 
 
 class SchemaParser:
@@ -177,7 +253,9 @@ class SchemaParser:
 
     def __init__(self, config, annotations=()):
         self._config = config
-        self._annotations = annotations
+        # Implementations filter output units by keyword,
+        # so make the membership test constant-time.
+        self._annotations = frozenset(annotations)
 
         # Used to indicate if the implementation pre-filtered annotations.
         self._filtered = False
@@ -187,19 +265,24 @@ class SchemaParser:
 
 
 class JschonSchemaParser(SchemaParser):
+    # Compiling the OAS schema is expensive and a new parser is created
+    # for each document validated, so compile it once and share it.
+    _v30_schema = None
+    _v30_schema_lock = threading.Lock()
+
     def __init__(self, config, annotations=()):
         super().__init__(config, annotations)
         self._filtered = True
-        with open(
-            Path(__file__).parent /
-                '..' /
-                'schemas' /
-                'oas' /
-                'v3.0' /
-                'schema.json',
-            encoding='utf-8',
-        ) as schema_fp:
-            self._v30_schema = jschon.JSONSchema(json.load(schema_fp))
+        if JschonSchemaParser._v30_schema is None:
+            with JschonSchemaParser._v30_schema_lock:
+                # Another thread might have compiled it while we waited.
+                if JschonSchemaParser._v30_schema is None:
+                    JschonSchemaParser._v30_schema = self._load_v30_schema()
+
+    @staticmethod
+    def _load_v30_schema() -> jschon.JSONSchema:
+        with V30_SCHEMA_PATH.open('rb') as schema_fp:
+            return jschon.JSONSchema(json_loads(schema_fp.read()))
 
     def parse(self, data, oastype, output_format='basic'):
         schema = self._v30_schema
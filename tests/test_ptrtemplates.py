@@ -31,6 +31,7 @@ def test_escape(unescaped, escaped):
     ('~2', '{'),
     ('~3', '}'),
     ('~0~1~2~3', '~/{}'),
+    ('plain', 'plain'),
 ))
 def test_unescape(escaped, unescaped):
     import sys
@@ -0,0 +1,49 @@
+from oascomply.schemaparse import Location
+
+INSTANCE_BASE = 'https://example.com/openapi'
+
+TYPE_UNIT = {
+    'keywordLocation': '/$defs/PathItem/oasType',
+    'absoluteKeywordLocation':
+        'https://example.com/schema#/$defs/PathItem/oasType',
+    'instanceLocation': '/paths/~1foo',
+    'annotation': 'PathItem',
+}
+
+
+def test_location_hash_eq():
+    loc1 = Location.get(TYPE_UNIT, INSTANCE_BASE)
+    Location.clear_caches()
+    loc2 = Location.get(dict(TYPE_UNIT), INSTANCE_BASE)
+    assert loc1 is not loc2
+    assert loc1 == loc2
+    assert hash(loc1) == hash(loc2)
+    assert len({loc1, loc2}) == 1
+
+    other = Location.get(
+        dict(TYPE_UNIT, instanceLocation='/paths/~1bar'),
+        INSTANCE_BASE,
+    )
+    assert other != loc1
+
+
+def test_location_default_instance_base():
+    loc = Location.get(TYPE_UNIT)
+    assert str(loc.instance_uri).startswith('urn:uuid:')
+    assert str(loc.instance_uri).endswith('#/paths/~1foo')
+    assert Location.get(TYPE_UNIT).instance_uri == loc.instance_uri
+
+
+def test_location_shared_across_keywords():
+    loc = Location.get(TYPE_UNIT, INSTANCE_BASE)
+    children = Location.get(
+        dict(
+            TYPE_UNIT,
+            keywordLocation='/$defs/PathItem/oasChildren',
+            absoluteKeywordLocation=
+                'https://example.com/schema#/$defs/PathItem/oasChildren',
+        ),
+        INSTANCE_BASE,
+    )
+    assert children is loc
+    assert str(loc.schema_uri) == 'https://example.com/schema#/$defs/PathItem'